@@ -10,59 +10,97 @@ Features:
 
 from __future__ import annotations
 
+import gc
 import json
-from datetime import datetime
+import operator
+import os
+import pickle
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import wx
 import wx.html
 import wx.lib.scrolledpanel as scrolled
 
 import matplotlib
 matplotlib.use('WXAgg')
-import matplotlib.pyplot as plt
+# Let Agg merge line segments that fall within the same pixel
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+import matplotlib.cm
+from matplotlib.colors import to_hex
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
 from matplotlib.backends.backend_wxagg import NavigationToolbar2WxAgg as NavigationToolbar
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+try:
+    import orjson  # Optional: much faster parsing of large shot files
+except ImportError:
+    orjson = None
 
 
 def align_yaxis_zero(ax1, ax2):
     """
     Adjust y-axis limits of ax1 and ax2 so that zero appears at the same
     vertical position on both axes.
+
+    Reads each axis' limits once and sets them once, so it must run after
+    the final autoscale of a redraw: a later relim/autoscale_view would undo
+    the alignment.
     """
-    y1_min, y1_max = ax1.get_ylim()
-    y2_min, y2_max = ax2.get_ylim()
+    lims = np.array([ax1.get_ylim(), ax2.get_ylim()], dtype=np.float64)
 
     # Ensure zero is included in both axes
-    y1_min, y1_max = min(y1_min, 0), max(y1_max, 0)
-    y2_min, y2_max = min(y2_min, 0), max(y2_max, 0)
+    y_min = np.minimum(lims[:, 0], 0.0)
+    y_max = np.maximum(lims[:, 1], 0.0)
 
-    # Handle edge cases
-    if y1_max == 0 and y2_max == 0:
-        # Both entirely negative, zero is at top
-        return
-    if y1_min == 0 and y2_min == 0:
-        # Both entirely positive, zero is at bottom
+    # Zero is already at the same edge of both axes (top or bottom)
+    if not y_max.any() or not y_min.any():
         return
 
-    # Calculate negative/positive ratios
-    ratio1 = -y1_min / y1_max if y1_max > 0 else float('inf')
-    ratio2 = -y2_min / y2_max if y2_max > 0 else float('inf')
+    # Use the larger negative/positive ratio for both (so neither axis clips data)
+    positive = y_max > 0
+    target_ratio = np.max(-y_min[positive] / y_max[positive])
+
+    for ax, top, has_positive in zip((ax1, ax2), y_max, positive):
+        if has_positive:
+            ax.set_ylim(-target_ratio * top, top)
 
-    # Use the larger ratio for both (so neither axis clips data)
-    target_ratio = max(ratio1, ratio2)
 
-    # Apply to ax1
-    if y1_max > 0:
-        new_y1_min = -target_ratio * y1_max
-        ax1.set_ylim(new_y1_min, y1_max)
+def minmax_downsample(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series to the min and max point of each of n_buckets buckets.
 
-    # Apply to ax2
-    if y2_max > 0:
-        new_y2_min = -target_ratio * y2_max
-        ax2.set_ylim(new_y2_min, y2_max)
+    At one bucket per pixel column this draws the same envelope as the full
+    series, and it is fully vectorized. The first and last points are kept.
+    """
+    n = len(x)
+    if n_buckets < 1 or n <= 2 * n_buckets:
+        return x, y
+
+    # Equal-size buckets; the last one is padded with NaN, which is never picked
+    # over a real value
+    size = -(-n // n_buckets)
+    n_full = -(-n // size)
+    buckets = np.full(n_full * size, np.nan)
+    buckets[:n] = y
+    buckets = buckets.reshape(n_full, size)
+    nan = np.isnan(buckets)
+    lo = np.argmin(np.where(nan, np.inf, buckets), axis=1)
+    hi = np.argmax(np.where(nan, -np.inf, buckets), axis=1)
+    offsets = np.arange(n_full) * size
+    keep = np.concatenate(([0], lo + offsets, hi + offsets, [n - 1]))
+    # Sorted into time order; an all-padding position can only be the last bucket's
+    keep = np.unique(np.minimum(keep, n - 1))
+    return x[keep], y[keep]
 
 
 # Data field definitions: (path, display_name, category, unit)
@@ -102,73 +140,286 @@ DATA_FIELDS = [
     (["sensors", "adc_3"], "ADC 3", "ADC", ""),
 ]
 
+# DATA_FIELDS keyed by dotted path ("shot.pressure" -> (path, name, category, unit)),
+# and the field keys of each category in display order
+FIELDS_BY_KEY: Dict[str, Tuple[Tuple[str, ...], str, str, str]] = {
+    ".".join(path): (tuple(path), name, category, unit) for path, name, category, unit in DATA_FIELDS
+}
+FIELDS_BY_CATEGORY: Dict[str, List[str]] = {
+    category: [key for key, spec in FIELDS_BY_KEY.items() if spec[2] == category]
+    for category in dict.fromkeys(spec[2] for spec in DATA_FIELDS)
+}
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259 and rejects NaN/Infinity literals,
+            # which the stdlib parser accepts
+            return json.loads(data)
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_float(val: Any) -> float:
+    """Convert a raw JSON value to float, mapping missing/invalid values to NaN."""
+    if val is None:
+        return float("nan")
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def extract_columns(records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Extract every DATA_FIELDS series from the records.
 
-def safe_get(d: Dict[str, Any], path: List[str], default=float("nan")):
-    """Safely navigate nested dict."""
-    cur: Any = d
-    for k in path:
-        if not isinstance(cur, dict) or k not in cur:
-            return default
-        cur = cur[k]
-    return cur
+    Fields are grouped by their parent path (e.g. "shot", "shot.setpoints",
+    "sensors"); for each group the parent dict is resolved once per record
+    and all of its values are fetched with one itemgetter call. Each group's
+    rows are then converted to float64 in one NumPy call. Returns
+    {field_key: float64 array}.
+    """
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    for path, _, _, _ in FIELDS_BY_KEY.values():
+        groups.setdefault(path[:-1], []).append(path[-1])
+
+    columns: Dict[str, np.ndarray] = {}
+    for parent_path, names in groups.items():
+        # itemgetter returns a bare value (not a tuple) for a single key
+        getter = operator.itemgetter(*names) if len(names) > 1 else (lambda d, k=names[0]: (d[k],))
+        missing = (None,) * len(names)
+
+        rows = []
+        for r in records:
+            parent: Any = r
+            for k in parent_path:
+                parent = parent.get(k) if isinstance(parent, dict) else None
+            if not isinstance(parent, dict):
+                rows.append(missing)
+                continue
+            try:
+                rows.append(getter(parent))
+            except KeyError:
+                # Some fields missing from this record: fall back to per-key lookups
+                rows.append(tuple(parent.get(k) for k in names))
 
+        try:
+            # None becomes NaN; numeric strings are parsed
+            table = np.array(rows, dtype=np.float64).reshape(len(rows), len(names))
+        except (TypeError, ValueError):
+            # Non-numeric values present: retry column by column, so only the
+            # offending columns fall back to element-by-element conversion
+            table = np.empty((len(rows), len(names)), dtype=np.float64)
+            for j in range(len(names)):
+                col = [row[j] for row in rows]
+                try:
+                    table[:, j] = np.array(col, dtype=np.float64)
+                except (TypeError, ValueError):
+                    table[:, j] = [to_float(v) for v in col]
+
+        for j, name in enumerate(names):
+            columns[".".join(parent_path + (name,))] = np.ascontiguousarray(table[:, j])
+    return columns
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    Replace NaN gaps with the last preceding valid value.
 
-def infer_time_scale(times_raw: List[float]) -> float:
+    Leading NaNs and NaNs after the last valid value are kept, so a series
+    is not extended past the point where it stopped being reported.
+    """
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values
+    idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    filled = values[idx]
+    last = int(np.flatnonzero(valid)[-1])
+    filled[last + 1:] = np.nan
+    return filled
+
+
+def infer_time_scale(times_raw: np.ndarray) -> float:
     """Returns multiplier to convert time to seconds."""
     if len(times_raw) < 2:
         return 1.0
-    deltas = [abs(times_raw[i] - times_raw[i - 1]) for i in range(1, len(times_raw))]
-    deltas = [d for d in deltas if d > 0]
-    if not deltas:
+    deltas = np.abs(np.diff(times_raw))
+    deltas = deltas[deltas > 0]
+    if deltas.size == 0:
         return 1.0
-    deltas_sorted = sorted(deltas)
-    med = deltas_sorted[len(deltas_sorted) // 2]
+    med = np.median(deltas)
     return 1.0 / 1000.0 if med >= 5 else 1.0
 
 
+SHOT_INDEX_NAME = ".shot_index.json"
+
+# Top-level "time" number near the start of a shot file, preceded only by the
+# opening brace (no nested object/array, so it is not a record's "time").
+# The number must be followed by its terminator, so one cut off at the end of
+# the scanned head is not mistaken for a shorter value.
+_PEEK_TIME_RE = re.compile(rb'\A\s*\{[^{}\[\]]*?"time"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?=\s*[,}])')
+
+
+def peek_shot_time(path: Path) -> Any:
+    """
+    Return a shot file's top-level "time" without parsing the whole file.
+
+    Only the first 4 KB are scanned; if the key is not found there, ahead of
+    any nested data, the file is parsed in full instead.
+    """
+    with path.open("rb") as f:
+        head = f.read(4096)
+    m = _PEEK_TIME_RE.match(head)
+    if m:
+        return json.loads(m.group(1))
+    return read_json(path).get("time", 0)
+
+
+def scan_shot_times(directory: Path) -> List[Tuple[Path, Any]]:
+    """
+    Return (path, shot_time) for every *.shot.json in directory.
+
+    Shot times are remembered in a sidecar index ({filename: [mtime, shot_time]})
+    so only new or modified files have to be read.
+    """
+    index_path = directory / SHOT_INDEX_NAME
+    try:
+        index = read_json(index_path)
+        if not isinstance(index, dict):
+            index = {}
+    except Exception:
+        index = {}
+
+    files_with_time = []
+    new_index = {}
+    for path in directory.glob("*.shot.json"):
+        try:
+            mtime = path.stat().st_mtime
+            entry = index.get(path.name)
+            if isinstance(entry, list) and len(entry) == 2 and entry[0] == mtime:
+                shot_time = entry[1]
+            else:
+                shot_time = peek_shot_time(path)
+            new_index[path.name] = [mtime, shot_time]
+            files_with_time.append((path, shot_time))
+        except Exception as e:
+            print(f"Failed to read time from {path}: {e}")
+
+    if new_index != index:
+        try:
+            with index_path.open("w", encoding="utf-8") as f:
+                json.dump(new_index, f)
+        except OSError as e:
+            print(f"Failed to write {index_path}: {e}")
+
+    return files_with_time
+
+
 class ShotData:
     """Container for loaded shot data."""
 
+    # Bump when the meaning of the cached arrays changes (extraction, gap filling, ...)
+    CACHE_VERSION = 2
+
     def __init__(self, path: Path):
         self.path = path
         self.profile_name = "Unknown"
         self.shot_time: Optional[float] = None
-        self.records: List[Dict[str, Any]] = []
-        self.time_s: List[float] = []
+        self.time_s: np.ndarray = np.empty(0)
+        self._columns: Dict[str, np.ndarray] = {}
         self._load()
 
     def _load(self):
-        with self.path.open("r", encoding="utf-8") as f:
-            doc = json.load(f)
+        # Taken before reading, so the cache records the file version it was built from
+        source = self.path.stat()
+        if self._load_cache(source):
+            return
+
+        doc = read_json(self.path)
 
         if "data" not in doc or not isinstance(doc["data"], list):
             raise ValueError("JSON missing 'data' list")
 
         self.profile_name = doc.get("profile_name", "Unknown Profile")
         self.shot_time = doc.get("time", None)
-        self.records = doc["data"]
+        records = doc["data"]
 
         # Build time series
-        times_raw = [float(r.get("time", 0.0)) for r in self.records]
-        t0 = times_raw[0] if times_raw else 0.0
+        times_raw = np.fromiter((float(r.get("time", 0.0)) for r in records),
+                                dtype=np.float64, count=len(records))
+        t0 = times_raw[0] if times_raw.size else 0.0
         scale = infer_time_scale(times_raw)
-        self.time_s = [(t - t0) * scale for t in times_raw]
+        self.time_s = (times_raw - t0) * scale
 
-    def get_series(self, path: List[str]) -> List[float]:
-        """Extract a data series by path."""
-        result = []
-        for r in self.records:
-            val = safe_get(r, path, float("nan"))
-            try:
-                result.append(float(val) if val is not None else float("nan"))
-            except (TypeError, ValueError):
-                result.append(float("nan"))
-        return result
+        # Keep only the columnar arrays; the parsed record dicts are several
+        # times larger than the data they hold and are dropped with `doc`.
+        self._columns = extract_columns(records)
+
+        self._save_cache(source)
+
+    def _cache_path(self) -> Path:
+        """Sidecar cache of the parsed arrays (foo.shot.json -> foo.shot.json.cache.npz)."""
+        # Append rather than swap the suffix so the cache can never collide
+        # with (and overwrite) a user's own foo.npz next to foo.json
+        return self.path.with_name(self.path.name + ".cache.npz")
+
+    def _load_cache(self, source: os.stat_result) -> bool:
+        """Load parsed arrays from the sidecar cache if it was built from this exact file."""
+        try:
+            with np.load(self._cache_path(), allow_pickle=False) as data:
+                if int(data["version"]) != self.CACHE_VERSION:
+                    return False
+                # Exact match rather than "cache is newer": a file replaced by one
+                # with an older mtime (cp -p, rsync -t, a restore) must not reuse it
+                if (int(data["source_mtime_ns"]) != source.st_mtime_ns
+                        or int(data["source_size"]) != source.st_size):
+                    return False
+                # Raises KeyError if DATA_FIELDS gained a field since caching
+                columns = {key: data["col:" + key] for key in FIELDS_BY_KEY}
+                time_s = data["time_s"]
+                profile_name = str(data["profile_name"])
+                shot_time = float(data["shot_time"])
+        except Exception:
+            # Missing, stale or unreadable cache: parse the JSON instead
+            return False
+
+        self.profile_name = profile_name
+        self.shot_time = None if np.isnan(shot_time) else shot_time
+        self.time_s = time_s
+        self._columns = columns
+        return True
+
+    def _save_cache(self, source: os.stat_result):
+        """Write the parsed arrays next to the JSON file (best effort)."""
+        try:
+            shot_time = np.nan if self.shot_time is None else float(self.shot_time)
+            with self._cache_path().open("wb") as f:
+                np.savez(f, version=self.CACHE_VERSION, profile_name=str(self.profile_name),
+                         source_mtime_ns=source.st_mtime_ns, source_size=source.st_size,
+                         shot_time=shot_time, time_s=self.time_s,
+                         **{"col:" + key: col for key, col in self._columns.items()})
+        except (OSError, TypeError, ValueError):
+            # Read-only directory or unusual metadata: just skip caching
+            pass
+
+    def get_series(self, key: str) -> np.ndarray:
+        """Get a data series by dotted key, e.g. "shot.pressure" (all-NaN for unknown fields)."""
+        col = self._columns.get(key)
+        if col is None:
+            return np.full(len(self.time_s), np.nan)
+        return col
 
     def get_title(self) -> str:
         if self.shot_time:
-            dt = datetime.fromtimestamp(self.shot_time)
-            return f"{self.profile_name} – {dt.strftime('%Y-%m-%d %H:%M:%S')}"
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.shot_time))
+            return f"{self.profile_name} – {stamp}"
         return self.profile_name
 
     def get_short_name(self) -> str:
@@ -177,8 +428,7 @@ class ShotData:
     def get_date_label(self) -> str:
         """Get a short date/time label for display."""
         if self.shot_time:
-            dt = datetime.fromtimestamp(self.shot_time)
-            return dt.strftime("%Y-%m-%d %H:%M")
+            return time.strftime("%Y-%m-%d %H:%M", time.localtime(self.shot_time))
         return self.path.stem
 
 
@@ -194,7 +444,7 @@ class FileSettingsDialog(wx.Dialog):
 
         # Calculate default duration (last time - first time)
         # Ensure max_duration is at least 0.1 to avoid GTK SpinCtrl assertion errors
-        self.max_duration = max(0.1, shot_data.time_s[-1] if shot_data.time_s else 0.1)
+        self.max_duration = max(0.1, float(shot_data.time_s[-1]) if len(shot_data.time_s) else 0.1)
         self.result_settings = current_settings.copy() if current_settings else {}
 
         if "trim_duration" not in self.result_settings:
@@ -462,9 +712,27 @@ class StyleDialog(wx.Dialog):
         return self.result_style
 
 
+@dataclass
+class FieldState:
+    """Widgets and line style of one data series row."""
+    checkbox: wx.CheckBox
+    secondary: wx.CheckBox  # Plot on the secondary Y-axis
+    style: Dict = field(default_factory=dict)  # {color, linestyle, linewidth}, empty for defaults
+
+
 class ShotViewerFrame(wx.Frame):
     """Main application frame."""
 
+    # Export formats: (file dialog label, extension)
+    EXPORT_FORMATS = [
+        ("PNG image", ".png"),
+        ("PDF document", ".pdf"),
+        ("SVG image", ".svg"),
+    ]
+
+    # Default line colors, as hex so they can go straight into the hover HTML
+    COLOR_CYCLE = [to_hex(c) for c in matplotlib.cm.tab10.colors]
+
     def __init__(self):
         super().__init__(None, title="Shot Viewer", size=(1400, 900))
 
@@ -472,13 +740,34 @@ class ShotViewerFrame(wx.Frame):
         self.shot2: Optional[ShotData] = None
         self.shot1_settings: Dict = {}
         self.shot2_settings: Dict = {}
-        self.field_checkboxes: Dict[str, wx.CheckBox] = {}
-        self.field_secondary: Dict[str, wx.CheckBox] = {}
-        self.field_styles: Dict[str, Dict] = {}  # {key: {color, linestyle, linewidth}}
+        self.fields: Dict[str, FieldState] = {}  # {key: FieldState}
+        # _get_selected_fields() result; reset to None whenever a checkbox changes
+        self._selected_cache: Optional[List[Tuple[str, str, str, bool]]] = None
 
         # Data for hover display
         self.plot_data: Dict = {}  # Stores current plot data for hover lookup
 
+        # Persistent plot artists, reused across redraws
+        self.ax2 = None  # Secondary Y-axis, created on first use
+        self._legend = None
+        self._legend_key: Optional[Tuple] = None  # Entries the current legend was built from
+        self._legend_lines: List[Any] = []  # Plotted lines in legend order
+        self._line_artists: Dict[Tuple[int, str], Any] = {}  # {(slot, key): Line2D}
+        self._line_sources: Dict[Tuple[int, str], Tuple[np.ndarray, np.ndarray]] = {}  # Full-resolution data
+        self._resample_suspended = False
+
+        # Hover cursor, blitted over the cached plot background
+        self._cursor: Optional[Line2D] = None
+        self._cursor_shown = False
+        self._hover_bg = None
+        self._last_hover_key: Optional[Tuple] = None  # (sample indices, time label) last shown on hover
+        self._hover_content: Optional[str] = None  # Content currently shown in the hover panel
+
+        # Pending debounced redraw (see _schedule_update)
+        self._plot_pending: Optional[wx.CallLater] = None
+        # Pending re-sampling once a zoom/pan settles (see _on_xlim_changed)
+        self._resample_pending: Optional[wx.CallLater] = None
+
         self._setup_ui()
         self._auto_load_json_files()
 
@@ -542,7 +831,7 @@ class ShotViewerFrame(wx.Frame):
 
         # Compare checkbox
         self.compare_cb = wx.CheckBox(left_panel, label="Compare mode (overlay)")
-        self.compare_cb.Bind(wx.EVT_CHECKBOX, lambda e: self._update_plot())
+        self.compare_cb.Bind(wx.EVT_CHECKBOX, lambda e: self._schedule_update())
         file_sizer.Add(self.compare_cb, 0, wx.ALL, 5)
 
         left_sizer.Add(file_sizer, 0, wx.EXPAND | wx.ALL, 5)
@@ -552,12 +841,15 @@ class ShotViewerFrame(wx.Frame):
         select_sizer = wx.StaticBoxSizer(select_box, wx.VERTICAL)
 
         self.scroll_panel = scrolled.ScrolledPanel(left_panel, size=(-1, 400))
-        self.scroll_panel.SetupScrolling(scroll_x=False)
         scroll_sizer = wx.BoxSizer(wx.VERTICAL)
 
+        # Build all rows with repaints suspended, then set up scrolling once
+        # for the final size instead of re-laying out per added row
+        self.scroll_panel.Freeze()
         self._create_checkboxes(scroll_sizer)
-
         self.scroll_panel.SetSizer(scroll_sizer)
+        self.scroll_panel.Thaw()
+        self.scroll_panel.SetupScrolling(scroll_x=False)
         select_sizer.Add(self.scroll_panel, 1, wx.EXPAND | wx.ALL, 5)
 
         left_sizer.Add(select_sizer, 1, wx.EXPAND | wx.ALL, 5)
@@ -587,8 +879,9 @@ class ShotViewerFrame(wx.Frame):
         btn_update.Bind(wx.EVT_BUTTON, lambda e: self._update_plot())
         left_sizer.Add(btn_update, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 5)
 
-        btn_export = wx.Button(left_panel, label="Export PNG")
-        btn_export.Bind(wx.EVT_BUTTON, lambda e: self._export_png())
+        btn_export = wx.Button(left_panel, label="Export")
+        btn_export.SetToolTip("Save the plot as PNG, PDF or SVG")
+        btn_export.Bind(wx.EVT_BUTTON, lambda e: self._export_plot())
         left_sizer.Add(btn_export, 0, wx.EXPAND | wx.ALL, 5)
 
         left_panel.SetSizer(left_sizer)
@@ -599,6 +892,9 @@ class ShotViewerFrame(wx.Frame):
 
         self.fig = Figure(figsize=(10, 7), dpi=100)
         self.ax = self.fig.add_subplot(111)
+        # Open-topped frame: the top spine carries no ticks or labels
+        self.ax.spines['top'].set_visible(False)
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
         self.canvas = FigureCanvas(right_panel, -1, self.fig)
 
         self.toolbar = NavigationToolbar(self.canvas)
@@ -612,6 +908,14 @@ class ShotViewerFrame(wx.Frame):
 
         # Connect mouse motion event
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        self.canvas.mpl_connect('figure_leave_event', lambda e: self._draw_cursor(None))
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+        # Vertical hover cursor. Not added to the axes, so clearing, autoscaling
+        # and exporting never see it; it is only ever blitted on screen.
+        self._cursor = Line2D([0, 0], [0, 1], transform=self.ax.get_xaxis_transform(),
+                              color="gray", linewidth=0.8, animated=True)
+        self._cursor.set_figure(self.fig)
 
         right_sizer.Add(self.toolbar, 0, wx.EXPAND)
         right_sizer.Add(self.canvas, 1, wx.EXPAND)
@@ -629,41 +933,34 @@ class ShotViewerFrame(wx.Frame):
 
     def _create_checkboxes(self, parent_sizer: wx.BoxSizer):
         """Create checkboxes organized by category."""
-        categories: Dict[str, List[Tuple]] = {}
-        for field in DATA_FIELDS:
-            cat = field[2]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(field)
-
-        for cat_name, fields in categories.items():
+        for cat_name, keys in FIELDS_BY_CATEGORY.items():
             # Category header
             header = wx.StaticText(self.scroll_panel, label=cat_name)
             header.SetFont(header.GetFont().Bold())
             parent_sizer.Add(header, 0, wx.TOP | wx.BOTTOM, 5)
 
-            for path, name, _, unit in fields:
-                key = ".".join(path)
+            for key in keys:
+                _, name, _, unit = FIELDS_BY_KEY[key]
                 label = f"{name}" + (f" ({unit})" if unit else "")
 
                 # Row with checkbox, secondary axis toggle, and style button
                 row_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
+                # All rows share the same handlers; the style button carries its field key as name
                 cb = wx.CheckBox(self.scroll_panel, label=label)
-                cb.Bind(wx.EVT_CHECKBOX, lambda e: self._update_plot())
-                self.field_checkboxes[key] = cb
+                cb.Bind(wx.EVT_CHECKBOX, self._on_field_toggle)
                 row_sizer.Add(cb, 1, wx.ALIGN_CENTER_VERTICAL)
 
                 cb2 = wx.CheckBox(self.scroll_panel, label="2nd")
                 cb2.SetToolTip("Plot on secondary Y-axis")
-                cb2.Bind(wx.EVT_CHECKBOX, lambda e: self._update_plot())
-                self.field_secondary[key] = cb2
+                cb2.Bind(wx.EVT_CHECKBOX, self._on_field_toggle)
+                self.fields[key] = FieldState(cb, cb2)
                 row_sizer.Add(cb2, 0, wx.LEFT | wx.ALIGN_CENTER_VERTICAL, 5)
 
                 # Style button
-                btn_style = wx.Button(self.scroll_panel, label="\u2699", size=(36, -1))
+                btn_style = wx.Button(self.scroll_panel, label="\u2699", size=(36, -1), name=key)
                 btn_style.SetToolTip("Customize line style")
-                btn_style.Bind(wx.EVT_BUTTON, lambda e, k=key, n=name: self._open_style_dialog(k, n))
+                btn_style.Bind(wx.EVT_BUTTON, self._on_style_button)
                 row_sizer.Add(btn_style, 0, wx.LEFT | wx.ALIGN_CENTER_VERTICAL, 3)
 
                 parent_sizer.Add(row_sizer, 0, wx.EXPAND | wx.LEFT, 15)
@@ -671,40 +968,34 @@ class ShotViewerFrame(wx.Frame):
         # Default selections
         defaults = ["shot.pressure", "shot.flow", "shot.weight"]
         for key in defaults:
-            if key in self.field_checkboxes:
-                self.field_checkboxes[key].SetValue(True)
+            if key in self.fields:
+                self.fields[key].checkbox.SetValue(True)
 
     def _auto_load_json_files(self):
         """Auto-load the 2 most recent JSON files based on datetime inside JSON."""
         script_dir = Path(__file__).parent
-        json_files = list(script_dir.glob("*.shot.json"))
-
-        # Read time from each JSON and sort by it (most recent first)
-        files_with_time = []
-        for path in json_files:
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    doc = json.load(f)
-                shot_time = doc.get("time", 0)
-                files_with_time.append((path, shot_time))
-            except Exception as e:
-                print(f"Failed to read time from {path}: {e}")
+        files_with_time = scan_shot_times(script_dir)
 
         # Sort by time descending (most recent first)
         files_with_time.sort(key=lambda x: x[1], reverse=True)
 
-        if len(files_with_time) >= 1:
+        # Parse both files concurrently; widgets are only updated below, on
+        # this (main) thread, once the loads have finished
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            loads = [pool.submit(ShotData, path) for path, _ in files_with_time[:2]]
+
+        if len(loads) >= 1:
             try:
-                self.shot1 = ShotData(files_with_time[0][0])
+                self.shot1 = loads[0].result()
                 self.shot1_label.SetLabel(self.shot1.get_date_label())
                 self.btn_settings1.Enable(True)
                 self.shot1_settings = {}
             except Exception as e:
                 print(f"Failed to load {files_with_time[0][0]}: {e}")
 
-        if len(files_with_time) >= 2:
+        if len(loads) >= 2:
             try:
-                self.shot2 = ShotData(files_with_time[1][0])
+                self.shot2 = loads[1].result()
                 self.shot2_label.SetLabel(self.shot2.get_date_label())
                 self.btn_settings2.Enable(True)
                 self.shot2_settings = {}
@@ -755,8 +1046,18 @@ class ShotViewerFrame(wx.Frame):
             self.shot2_label.SetLabel("(none)")
             self.btn_settings2.Enable(False)
             self.shot2_settings = {}
+        self._release_plot_data()
         self._update_plot()
 
+    def _release_plot_data(self):
+        """Drop the plotted lines and hover data so the arrays of unloaded shots can be freed."""
+        for line in self._line_artists.values():
+            line.remove()
+        self._line_artists.clear()
+        self._line_sources.clear()
+        self._legend_lines = []
+        self.plot_data = {}
+
     def _open_file_settings(self, slot: int):
         """Open file settings dialog for trim, etc."""
         if slot == 1:
@@ -777,7 +1078,8 @@ class ShotViewerFrame(wx.Frame):
                 self.shot1_settings = new_settings
             else:
                 self.shot2_settings = new_settings
-            self._update_plot()
+            # Coalesce slider drags; closing the dialog redraws immediately below
+            self._schedule_update(120)
 
         dlg = FileSettingsDialog(self, shot, current_settings, on_change_callback=on_settings_change)
         dlg.ShowModal()
@@ -798,113 +1100,149 @@ class ShotViewerFrame(wx.Frame):
         self._update_plot()
         dlg.Destroy()
 
+    def _on_field_toggle(self, event):
+        """A series checkbox or its secondary-axis toggle changed."""
+        self._selected_cache = None
+        self._schedule_update()
+
+    def _on_style_button(self, event):
+        """Open the style dialog for the series whose key is the button's name."""
+        key = event.GetEventObject().GetName()
+        self._open_style_dialog(key, FIELDS_BY_KEY[key][1])
+
     def _open_style_dialog(self, key: str, name: str):
         """Open dialog to customize line style."""
-        current_style = self.field_styles.get(key, {})
-        original_style = current_style.copy() if current_style else {}
+        state = self.fields[key]
+        current_style = state.style
+        original_style = current_style.copy()
 
         def on_style_change(new_style):
             """Live preview callback."""
-            if new_style:
-                self.field_styles[key] = new_style
-            elif key in self.field_styles:
-                del self.field_styles[key]
-            self._update_plot()
+            state.style = new_style or {}
+            # Restyle the plotted lines in place; closing the dialog redraws fully below
+            if not self._restyle_only(key):
+                self._schedule_update(120)
 
         dlg = StyleDialog(self, name, current_style, on_change_callback=on_style_change)
         dlg.ShowModal()
 
         if dlg.saved:
             # Save or Defaults was clicked - apply final style
-            new_style = dlg.get_style()
-            if new_style:
-                self.field_styles[key] = new_style
-            elif key in self.field_styles:
-                del self.field_styles[key]
+            state.style = dlg.get_style() or {}
         else:
             # Cancelled or closed - restore original style
-            if original_style:
-                self.field_styles[key] = original_style
-            elif key in self.field_styles:
-                del self.field_styles[key]
+            state.style = original_style
 
         self._update_plot()
         dlg.Destroy()
 
+    def _apply_selection(self, keys):
+        """
+        Check exactly the given field keys and redraw once.
+
+        Each checkbox is set once. SetValue() does not emit EVT_CHECKBOX, so the
+        only per-checkbox cost is repainting, and the panel is frozen to repaint once.
+        """
+        keys = set(keys)
+        self.scroll_panel.Freeze()
+        for key, state in self.fields.items():
+            state.checkbox.SetValue(key in keys)
+        self.scroll_panel.Thaw()
+        self._selected_cache = None
+        self._schedule_update()
+
     def _select_all(self):
-        for cb in self.field_checkboxes.values():
-            cb.SetValue(True)
-        self._update_plot()
+        self._apply_selection(self.fields)
 
     def _select_none(self):
-        for cb in self.field_checkboxes.values():
-            cb.SetValue(False)
-        self._update_plot()
+        self._apply_selection(())
 
     def _select_shot(self):
-        for cb in self.field_checkboxes.values():
-            cb.SetValue(False)
-        for key in ["shot.pressure", "shot.flow", "shot.weight", "shot.gravimetric_flow",
-                    "shot.setpoints.pressure", "shot.setpoints.flow", "shot.setpoints.power"]:
-            if key in self.field_checkboxes:
-                self.field_checkboxes[key].SetValue(True)
-        self._update_plot()
+        self._apply_selection(["shot.pressure", "shot.flow", "shot.weight", "shot.gravimetric_flow",
+                               "shot.setpoints.pressure", "shot.setpoints.flow", "shot.setpoints.power"])
 
     def _select_temps(self):
-        for cb in self.field_checkboxes.values():
-            cb.SetValue(False)
-        for key, cb in self.field_checkboxes.items():
-            if "temp" in key.lower() or key.startswith("sensors.external") or key.startswith("sensors.bar") or key == "sensors.tube":
-                cb.SetValue(True)
-        self._update_plot()
-
-    def _get_selected_fields(self) -> List[Tuple[List[str], str, str, bool]]:
-        """Get list of selected fields as (path, name, unit, is_secondary)."""
-        selected = []
-        for path, name, _, unit in DATA_FIELDS:
-            key = ".".join(path)
-            if self.field_checkboxes.get(key, wx.CheckBox()).GetValue():
-                is_secondary = self.field_secondary.get(key, wx.CheckBox()).GetValue()
-                selected.append((path, name, unit, is_secondary))
-        return selected
+        self._apply_selection(
+            key for key in self.fields
+            if "temp" in key.lower() or key.startswith("sensors.external") or key.startswith("sensors.bar") or key == "sensors.tube"
+        )
+
+    def _get_selected_fields(self) -> List[Tuple[str, str, str, bool]]:
+        """Get list of selected fields as (key, name, unit, is_secondary)."""
+        if self._selected_cache is None:
+            selected = []
+            for key, (_, name, _, unit) in FIELDS_BY_KEY.items():
+                state = self.fields.get(key)
+                if state is not None and state.checkbox.GetValue():
+                    selected.append((key, name, unit, state.secondary.GetValue()))
+            self._selected_cache = selected
+        return self._selected_cache
+
+    def _schedule_update(self, delay_ms: int = 50):
+        """Redraw after delay_ms, coalescing bursts of changes into one _update_plot."""
+        if self._plot_pending is not None and self._plot_pending.IsRunning():
+            self._plot_pending.Restart(delay_ms)
+        else:
+            self._plot_pending = wx.CallLater(delay_ms, self._update_plot)
 
     def _update_plot(self):
-        """Redraw the plot."""
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111)
+        """Redraw the plot, updating existing line artists in place where possible."""
+        # A direct redraw supersedes any pending debounced one, and re-samples
+        # the lines itself
+        if self._plot_pending is not None:
+            self._plot_pending.Stop()
+            self._plot_pending = None
+        if self._resample_pending is not None:
+            self._resample_pending.Stop()
+            self._resample_pending = None
+
+        # Cached hover background is stale until the next draw_event, and
+        # the hover values until the next mouse move
+        self._hover_bg = None
+        self._cursor_shown = False
+        self._last_hover_key = None
 
         if not self.shot1 and not self.shot2:
+            self._reset_axes()
             self.ax.set_title("No data loaded")
             self.plot_data = {}
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         selected = self._get_selected_fields()
         if not selected:
+            self._reset_axes()
             self.ax.set_title("No data series selected")
             self.plot_data = {}
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         compare = self.compare_cb.GetValue() and self.shot1 and self.shot2
 
         # Check if we need secondary axis
         has_secondary = any(is_sec for _, _, _, is_sec in selected)
-        ax2 = self.ax.twinx() if has_secondary else None
-
-        # Color cycle
-        colors = plt.cm.tab10.colors
+        ax2 = None
+        if has_secondary:
+            if self.ax2 is None:
+                self.ax2 = self.ax.twinx()
+                self.ax2.spines['top'].set_visible(False)
+            self.ax2.set_visible(True)
+            ax2 = self.ax2
+        elif self.ax2 is not None:
+            self.ax2.set_visible(False)
+
+        # Lines drawn by this update, in legend order: primary axis first
+        primary_lines = []
+        secondary_lines = []
+
+        # Color cycle; custom colors from StyleDialog are hex strings as well
+        colors = self.COLOR_CYCLE
 
         # Helper to get trimmed data
         def get_trimmed_data(shot, settings):
-            trim_duration = settings.get("trim_duration", shot.time_s[-1] if shot.time_s else 0)
-            # Find index where time exceeds trim_duration
-            trim_idx = len(shot.time_s)
-            for i, t in enumerate(shot.time_s):
-                if t > trim_duration:
-                    trim_idx = i
-                    break
-            return trim_idx
+            trim_duration = settings.get("trim_duration", shot.time_s[-1] if len(shot.time_s) else 0)
+            # Index of the first sample past trim_duration (time_s is sorted)
+            return int(np.searchsorted(shot.time_s, trim_duration, side="right"))
 
         if compare:
             # Get trim indices
@@ -920,48 +1258,49 @@ class ShotViewerFrame(wx.Frame):
                 "shot2_name": self.shot2.get_short_name(),
                 "time1": time1,
                 "time2": time2,
-                "series1": {},
-                "series2": {},
+                "series1": [],  # Stacked into (samples, fields) matrices below
+                "series2": [],
                 "fields": []
             }
 
             # Overlay mode: same field, different shots
-            for i, (path, name, unit, is_secondary) in enumerate(selected):
-                key = ".".join(path)
-                style = self.field_styles.get(key, {})
+            for i, (key, name, unit, is_secondary) in enumerate(selected):
+                style = self.fields[key].style
                 color = style.get("color") or colors[i % len(colors)]
                 linestyle = style.get("linestyle", "-")
                 linewidth = style.get("linewidth", 1.5)
                 target_ax = ax2 if is_secondary else self.ax
 
+                target_lines = secondary_lines if is_secondary else primary_lines
+
                 # Shot 1 (solid style from settings)
-                series1 = self.shot1.get_series(path)[:trim1]
+                series1 = self.shot1.get_series(key)[:trim1]
                 label1 = f"{name} ({self.shot1.get_short_name()})" + (" [2nd]" if is_secondary else "")
-                target_ax.plot(time1, series1, label=label1, color=color,
-                               linewidth=linewidth, linestyle=linestyle)
+                target_lines.append(self._plot_line((1, key), target_ax, time1, series1, label1,
+                                                    color, linestyle, linewidth))
 
                 # Shot 2 (dashed version)
-                series2 = self.shot2.get_series(path)[:trim2]
+                series2 = self.shot2.get_series(key)[:trim2]
                 label2 = f"{name} ({self.shot2.get_short_name()})" + (" [2nd]" if is_secondary else "")
                 # For comparison, shot2 uses dashed if shot1 is solid, or dotted if shot1 is already dashed
                 ls2 = "--" if linestyle == "-" else ":"
-                target_ax.plot(time2, series2, label=label2, color=color,
-                               linewidth=linewidth, linestyle=ls2)
+                target_lines.append(self._plot_line((2, key), target_ax, time2, series2, label2,
+                                                    color, ls2, linewidth))
 
                 # Store for hover (include color for display)
-                # Convert matplotlib color to hex
-                if isinstance(color, tuple):
-                    hex_color = '#%02x%02x%02x' % tuple(int(c * 255) for c in color[:3])
-                else:
-                    hex_color = color
-                self.plot_data["series1"][key] = series1
-                self.plot_data["series2"][key] = series2
-                self.plot_data["fields"].append((key, name, unit, hex_color))
+                self.plot_data["series1"].append(series1)
+                self.plot_data["series2"].append(series2)
+                self.plot_data["fields"].append((key, name, unit, color))
+
+            # One row per sample, so hover reads all fields of a shot with a single index
+            self.plot_data["series1"] = np.column_stack(self.plot_data["series1"])
+            self.plot_data["series2"] = np.column_stack(self.plot_data["series2"])
 
             self.ax.set_title(f"Comparison: {self.shot1.get_short_name()} vs {self.shot2.get_short_name()}")
         else:
             # Single shot mode
             shot = self.shot1 or self.shot2
+            slot = 1 if self.shot1 else 2
             settings = self.shot1_settings if self.shot1 else self.shot2_settings
             trim_idx = get_trimmed_data(shot, settings)
             time_trimmed = shot.time_s[:trim_idx]
@@ -970,63 +1309,238 @@ class ShotViewerFrame(wx.Frame):
             self.plot_data = {
                 "compare": False,
                 "time": time_trimmed,
-                "series": {},
+                "series": [],  # Stacked into a (samples, fields) matrix below
                 "fields": []
             }
 
-            for i, (path, name, unit, is_secondary) in enumerate(selected):
-                key = ".".join(path)
-                style = self.field_styles.get(key, {})
+            for i, (key, name, unit, is_secondary) in enumerate(selected):
+                style = self.fields[key].style
                 color = style.get("color") or colors[i % len(colors)]
                 linestyle = style.get("linestyle", "-")
                 linewidth = style.get("linewidth", 1.5)
                 target_ax = ax2 if is_secondary else self.ax
 
-                series = shot.get_series(path)[:trim_idx]
+                target_lines = secondary_lines if is_secondary else primary_lines
+
+                series = shot.get_series(key)[:trim_idx]
                 label = f"{name}" + (f" ({unit})" if unit else "") + (" [2nd]" if is_secondary else "")
-                target_ax.plot(time_trimmed, series, label=label, color=color,
-                               linewidth=linewidth, linestyle=linestyle)
+                target_lines.append(self._plot_line((slot, key), target_ax, time_trimmed, series, label,
+                                                    color, linestyle, linewidth))
 
                 # Store for hover (include color for display)
-                if isinstance(color, tuple):
-                    hex_color = '#%02x%02x%02x' % tuple(int(c * 255) for c in color[:3])
-                else:
-                    hex_color = color
-                self.plot_data["series"][key] = series
-                self.plot_data["fields"].append((key, name, unit, hex_color))
+                self.plot_data["series"].append(series)
+                self.plot_data["fields"].append((key, name, unit, color))
+
+            self.plot_data["series"] = np.column_stack(self.plot_data["series"])
 
             self.ax.set_title(shot.get_title())
 
+        # Matrix column of each field
+        self.plot_data["columns"] = {f[0]: j for j, f in enumerate(self.plot_data["fields"])}
+
+        # Drop lines for series that are no longer plotted
+        all_lines = primary_lines + secondary_lines
+        for line_key, line in list(self._line_artists.items()):
+            if line not in all_lines:
+                line.remove()
+                del self._line_artists[line_key]
+                del self._line_sources[line_key]
+
+        # Rescale to the full-resolution data (set_data does not update limits),
+        # then downsample once for the resulting view. A hidden twin is re-limited
+        # too: it shares x with self.ax and would otherwise keep its old extent.
+        self._resample_suspended = True
+        for axis in (self.ax, self.ax2):
+            if axis is not None:
+                axis.set_autoscale_on(True)
+                axis.relim()
+                axis.autoscale_view()
+        self._resample_suspended = False
+        self._resample_lines()
+
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel("Primary Axis")
         self.ax.grid(True, alpha=0.3)
 
         if ax2:
             ax2.set_ylabel("Secondary Axis")
+            # Exactly once per redraw: after every line is set and autoscaled,
+            # before the canvas is drawn
             align_yaxis_zero(self.ax, ax2)
 
-        # Combined legend at bottom
-        lines1, labels1 = self.ax.get_legend_handles_labels()
-        if ax2:
-            lines2, labels2 = ax2.get_legend_handles_labels()
-            all_lines = lines1 + lines2
-            all_labels = labels1 + labels2
-        else:
-            all_lines = lines1
-            all_labels = labels1
-
-        # Place legend below the plot, full width
-        ncol = min(len(all_lines), 4)  # Up to 4 columns
-        self.fig.legend(all_lines, all_labels, loc='lower center', bbox_to_anchor=(0.5, 0),
-                        ncol=ncol, fontsize=8, frameon=True)
+        self._legend_lines = all_lines
+        self._update_legend()
+        ncol = min(len(all_lines), 4)
 
         # Adjust layout to make room for legend
         self.fig.tight_layout()
         self.fig.subplots_adjust(bottom=0.15 + 0.03 * ((len(all_lines) - 1) // ncol))
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        self.toolbar.update()  # Reset zoom/pan history for the new data
+
+    def _update_legend(self):
+        """
+        Build the combined legend below the plot for the current lines.
+
+        Legend entries copy each line's style when built, so it is only
+        rebuilt when labels or styles actually change.
+        """
+        lines = self._legend_lines
+        legend_key = tuple((line.get_label(), line.get_color(), line.get_linestyle(), line.get_linewidth())
+                           for line in lines)
+        if legend_key == self._legend_key:
+            return
+        if self._legend is not None:
+            self._legend.remove()
+        # Place legend below the plot, full width, up to 4 columns
+        self._legend = self.fig.legend(lines, [line.get_label() for line in lines], loc='lower center',
+                                       bbox_to_anchor=(0.5, 0), ncol=min(len(lines), 4), fontsize=8, frameon=True)
+        self._legend_key = legend_key
+
+    def _restyle_only(self, key: str) -> bool:
+        """
+        Apply the current style of field key to its plotted lines in place.
+
+        Returns False if the field is not plotted, in which case a full
+        _update_plot is needed for the change to show up.
+        """
+        column = self.plot_data.get("columns", {}).get(key)
+        lines = [(slot, line) for (slot, line_key), line in self._line_artists.items() if line_key == key]
+        if column is None or not lines:
+            return False
+
+        style = self.fields[key].style
+        # Same defaults as _update_plot; the field's column is its position in the plot order
+        color = style.get("color") or self.COLOR_CYCLE[column % len(self.COLOR_CYCLE)]
+        linestyle = style.get("linestyle", "-")
+        linewidth = style.get("linewidth", 1.5)
+        for slot, line in lines:
+            if self.plot_data["compare"] and slot == 2:
+                ls = "--" if linestyle == "-" else ":"
+            else:
+                ls = linestyle
+            line.set_color(color)
+            line.set_linestyle(ls)
+            line.set_linewidth(linewidth)
+
+        _, name, unit, _ = self.plot_data["fields"][column]
+        self.plot_data["fields"][column] = (key, name, unit, color)
+
+        self._update_legend()
+        self._hover_bg = None
+        self._last_hover_key = None  # Hover colors changed
+        self.canvas.draw_idle()
+        return True
+
+    def _plot_line(self, line_key: Tuple[int, str], target_ax, time_arr: np.ndarray, series: np.ndarray,
+                   label: str, color, linestyle: str, linewidth: float):
+        """
+        Plot a series, updating the existing Line2D for line_key in place when possible.
+
+        The line starts out with the full-resolution data so autoscaling sees the
+        true extent; _resample_lines() reduces it to the visible view afterwards.
+        """
+        if line_key[1] in FIELDS_BY_CATEGORY["Setpoints"]:
+            # Setpoints are not emitted on every sample; they hold until changed,
+            # so fill the gaps to draw each one as a single continuous step line.
+            # Only the drawn copy is filled: hover shows the raw values.
+            series = forward_fill(series)
+        self._line_sources[line_key] = (time_arr, series)
+        line = self._line_artists.get(line_key)
+        if line is not None and line.axes is target_ax:
+            line.set_data(time_arr, series)
+            line.set_label(label)
+            line.set_color(color)
+            line.set_linestyle(linestyle)
+            line.set_linewidth(linewidth)
+            return line
+
+        # New series, or it moved between the primary and secondary axis.
+        # Rasterized: the dense polyline is drawn as one image while axes,
+        # labels and legend stay vector.
+        if line is not None:
+            line.remove()
+        line, = target_ax.plot(time_arr, series, label=label, color=color,
+                               linewidth=linewidth, linestyle=linestyle, rasterized=True)
+        self._line_artists[line_key] = line
+        return line
+
+    def _reset_axes(self):
+        """Clear the persistent axes, line artists and legend."""
+        self._line_artists.clear()
+        self._line_sources.clear()
+        self.ax.cla()
+        # cla() also drops the axes callbacks
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        if self.ax2 is not None:
+            self.ax2.cla()
+            # cla() resets the twin's right-hand layout set up by twinx()
+            self.ax2.yaxis.tick_right()
+            self.ax2.yaxis.set_label_position("right")
+            self.ax2.xaxis.set_visible(False)
+            self.ax2.patch.set_visible(False)
+            self.ax2.set_visible(False)
+        if self._legend is not None:
+            self._legend.remove()
+            self._legend = None
+            self._legend_key = None
+        self._legend_lines = []
+
+    def _decimate(self, time_arr: np.ndarray, series: np.ndarray, width_px: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduce series much longer than width_px to their per-pixel min/max."""
+        if len(time_arr) > 4 * width_px:
+            return minmax_downsample(time_arr, series, width_px)
+        return time_arr, series
+
+    def _resample_lines(self):
+        """
+        Redo each line's downsampling from its full data around the visible time range.
+
+        One view width is kept on either side, at the same density, so a pan
+        shows real data while it is in progress and is re-sampled once it settles.
+        """
+        x_min, x_max = self.ax.get_xlim()
+        span = x_max - x_min
+        px_per_s = max(int(self.ax.bbox.width), 1) / span if span > 0 else 0.0
+        for line_key, line in self._line_artists.items():
+            time_arr, series = self._line_sources[line_key]
+            # One extra point either side so the line runs off the covered range
+            start = max(int(np.searchsorted(time_arr, x_min - span)) - 1, 0)
+            end = min(int(np.searchsorted(time_arr, x_max + span, side="right")) + 1, len(time_arr))
+            if end <= start:
+                line.set_data(time_arr[:0], series[:0])
+                continue
+            # Pixel width the covered data would span at the current zoom
+            width_px = max(int((time_arr[end - 1] - time_arr[start]) * px_per_s), 1)
+            line.set_data(*self._decimate(time_arr[start:end], series[start:end], width_px))
+
+    def _on_xlim_changed(self, ax):
+        """Re-downsample for the new view once a zoom or pan has settled."""
+        # The cached hover background shows the old view until the next draw_event
+        self._hover_bg = None
+        self._cursor_shown = False
+        if self._resample_suspended or not self._line_artists:
+            return
+        # A toolbar pan changes the limits on every mouse motion; restart the
+        # timer like _schedule_update so only the final view is re-sampled
+        if self._resample_pending is not None and self._resample_pending.IsRunning():
+            self._resample_pending.Restart(150)
+        else:
+            self._resample_pending = wx.CallLater(150, self._on_view_settled)
+
+    def _on_view_settled(self):
+        """Re-sample the lines for the current view and redraw."""
+        self._resample_pending = None
+        self._resample_lines()
+        self.canvas.draw_idle()
 
     def _set_hover_html(self, content, num_rows=1):
         """Set HTML content in the hover panel and adjust height."""
+        # Mouse moves outside the axes repeat the placeholder on every event;
+        # re-parsing an unchanged page would only cause flicker
+        if content == self._hover_content:
+            return
+        self._hover_content = content
         html = f"""
         <html><body style="background-color: #fafafa; margin: 4px; padding: 0;">
         <font size="3" face="Arial, sans-serif">{content}</font>
@@ -1039,28 +1553,62 @@ class ShotViewerFrame(wx.Frame):
             self.hover_html.SetMinSize((-1, new_height))
             self.hover_html.GetParent().Layout()
 
+    def _on_canvas_draw(self, event):
+        """Cache the freshly drawn plot area for blitting the hover cursor."""
+        self._hover_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._cursor_shown = False
+
+    def _draw_cursor(self, x: Optional[float]):
+        """Blit the hover cursor at time x over the cached background (None hides it)."""
+        if self._hover_bg is None or (x is None and not self._cursor_shown):
+            return
+        if self.toolbar.mode:
+            # Pan/zoom in progress: the toolbar redraws the canvas itself
+            return
+        self.canvas.restore_region(self._hover_bg)
+        if x is not None:
+            self._cursor.set_xdata([x, x])
+            self.ax.draw_artist(self._cursor)
+        self.canvas.blit(self.ax.bbox)
+        self._cursor_shown = x is not None
+
     def _on_mouse_move(self, event):
         """Handle mouse movement over the plot to show values."""
         if not event.inaxes or not self.plot_data:
+            self._draw_cursor(None)
+            self._last_hover_key = None
             self._set_hover_html("<span style='color: #666;'>Hover over plot to see values</span>", 1)
             return
 
         x = event.xdata  # Time value
         if x is None:
             return
+        self._draw_cursor(x)
 
         def find_nearest_idx(time_array, target):
-            """Find index of nearest time value."""
-            if not time_array:
+            """Find index of nearest time value (time_array is sorted ascending)."""
+            n = len(time_array)
+            if n == 0:
                 return None
-            best_idx = 0
-            best_diff = abs(time_array[0] - target)
-            for i, t in enumerate(time_array):
-                diff = abs(t - target)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_idx = i
-            return best_idx
+            idx = int(np.searchsorted(time_array, target))
+            # Step back when the left neighbour is at least as close (ties go left),
+            # to the first of any repeated timestamps
+            if idx > 0 and (idx == n or target - time_array[idx - 1] <= time_array[idx] - target):
+                idx = int(np.searchsorted(time_array, time_array[idx - 1]))
+            return idx
+
+        # Nearest sample(s) under the cursor
+        is_compare = self.plot_data.get("compare")
+        if is_compare:
+            indices = (find_nearest_idx(self.plot_data["time1"], x), find_nearest_idx(self.plot_data["time2"], x))
+        else:
+            indices = (find_nearest_idx(self.plot_data["time"], x),)
+
+        # Moves within the same sample(s) and time label would rebuild identical HTML
+        hover_key = (indices, f"{x:.2f}")
+        if hover_key == self._last_hover_key:
+            return
+        self._last_hover_key = hover_key
 
         def format_value(val, unit):
             """Format a value with its unit."""
@@ -1105,30 +1653,34 @@ class ShotViewerFrame(wx.Frame):
 
         # Build items list with ordered fields
         items = []
-        is_compare = self.plot_data.get("compare")
         ordered_fields = order_fields(self.plot_data["fields"])
 
         if is_compare:
             # Compare mode: show values from both shots
-            idx1 = find_nearest_idx(self.plot_data["time1"], x)
-            idx2 = find_nearest_idx(self.plot_data["time2"], x)
+            idx1, idx2 = indices
             s1_name = self.plot_data["shot1_name"]
             s2_name = self.plot_data["shot2_name"]
 
+            # Rows of the (samples, fields) matrices; time and matrix lengths match
+            row1 = self.plot_data["series1"][idx1] if idx1 is not None else None
+            row2 = self.plot_data["series2"][idx2] if idx2 is not None else None
+            columns = self.plot_data["columns"]
+
             for key, name, unit, hex_color in ordered_fields:
-                val1 = self.plot_data["series1"][key][idx1] if idx1 is not None and idx1 < len(self.plot_data["series1"][key]) else None
-                val2 = self.plot_data["series2"][key][idx2] if idx2 is not None and idx2 < len(self.plot_data["series2"][key]) else None
+                val1 = row1[columns[key]] if row1 is not None else None
+                val2 = row2[columns[key]] if row2 is not None else None
                 items.append(
                     f"{color_square(hex_color)} <b>{name}:</b> "
                     f"{format_value(val1, unit)} / {format_value(val2, unit)}"
                 )
         else:
             # Single shot mode
-            idx = find_nearest_idx(self.plot_data["time"], x)
+            idx, = indices
             if idx is not None:
+                row = self.plot_data["series"][idx]
+                columns = self.plot_data["columns"]
                 for key, name, unit, hex_color in ordered_fields:
-                    series = self.plot_data["series"][key]
-                    val = series[idx] if idx < len(series) else None
+                    val = row[columns[key]]
                     items.append(f"{color_square(hex_color)} <b>{name}:</b> {format_value(val, unit)}")
 
         # Determine columns based on number of items and mode
@@ -1154,12 +1706,13 @@ class ShotViewerFrame(wx.Frame):
         num_rows = 1 + ((num_items + cols - 1) // cols if items else 0)
         self._set_hover_html("".join(html_parts), num_rows)
 
-    def _export_png(self):
-        """Export current plot to PNG."""
+    def _export_plot(self):
+        """Export current plot to PNG, PDF or SVG."""
+        wildcard = "|".join(f"{label} (*{ext})|*{ext}" for label, ext in self.EXPORT_FORMATS)
         with wx.FileDialog(
             self,
-            "Export PNG",
-            wildcard="PNG files (*.png)|*.png",
+            "Export Plot",
+            wildcard=wildcard,
             defaultDir=str(Path(__file__).parent),
             style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
         ) as dlg:
@@ -1167,11 +1720,54 @@ class ShotViewerFrame(wx.Frame):
                 return
 
             path = dlg.GetPath()
-            if not path.endswith(".png"):
-                path += ".png"
+            # Format follows the file suffix, else the selected filter
+            if not any(path.lower().endswith(ext) for _, ext in self.EXPORT_FORMATS):
+                path += self.EXPORT_FORMATS[dlg.GetFilterIndex()][1]
+
+        # Snapshot on the GUI thread, render in the background
+        fig = self._offscreen_copy()
+        threading.Thread(target=self._export_worker, args=(fig, path), daemon=True).start()
+
+    def _export_worker(self, fig: Figure, path: str):
+        """Render an export on a worker thread and report the result on the GUI thread."""
+        try:
+            self._save_figure(fig, path)
+        except Exception as e:
+            wx.CallAfter(wx.MessageBox, f"Failed to export plot:\n{e}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        wx.CallAfter(wx.MessageBox, f"Saved to:\n{path}", "Export", wx.OK | wx.ICON_INFORMATION)
 
-        self.fig.savefig(path, dpi=200, bbox_inches="tight")
-        wx.MessageBox(f"Saved to:\n{path}", "Export", wx.OK | wx.ICON_INFORMATION)
+    def _save_figure(self, fig: Figure, path: str):
+        """
+        Render a figure to a file, with the format taken from its suffix.
+
+        PNG is rendered at 200 DPI. For PDF/SVG, axes and text stay vector and
+        only the (rasterized) data lines are embedded as an image at 150 DPI.
+        """
+        is_vector = Path(path).suffix.lower() in (".pdf", ".svg")
+        # Layout is already tight (see _update_plot), so skip bbox_inches="tight"
+        # and the extra render pass it needs to measure the figure
+        fig.savefig(path, dpi=150 if is_vector else 200)
+
+    def _offscreen_copy(self) -> Figure:
+        """
+        Copy the current figure onto an off-screen Agg canvas.
+
+        Rendering the copy never touches the on-screen WXAgg canvas or the wx
+        event loop, so it is safe on a worker thread, and the copy does not
+        change if the plot is redrawn meanwhile. The on-screen lines are
+        decimated to the axes width, so the copies get their full-resolution
+        data back.
+        """
+        fig = pickle.loads(pickle.dumps(self.fig))
+        sources = {id(line): self._line_sources[key] for key, line in self._line_artists.items()}
+        # The pickled copy keeps the axes and their lines in the same order
+        for ax, ax_copy in zip(self.fig.axes, fig.axes):
+            for line, line_copy in zip(ax.lines, ax_copy.lines):
+                if id(line) in sources:
+                    line_copy.set_data(*sources[id(line)])
+        FigureCanvasAgg(fig)
+        return fig
 
     def _save_session(self):
         """Save current session configuration to a JSON file."""
@@ -1196,9 +1792,9 @@ class ShotViewerFrame(wx.Frame):
             "shot1_settings": self.shot1_settings,
             "shot2_settings": self.shot2_settings,
             "compare_mode": self.compare_cb.GetValue(),
-            "field_checkboxes": {key: cb.GetValue() for key, cb in self.field_checkboxes.items()},
-            "field_secondary": {key: cb.GetValue() for key, cb in self.field_secondary.items()},
-            "field_styles": self.field_styles,
+            "field_checkboxes": {key: state.checkbox.GetValue() for key, state in self.fields.items()},
+            "field_secondary": {key: state.secondary.GetValue() for key, state in self.fields.items()},
+            "field_styles": {key: state.style for key, state in self.fields.items() if state.style},
         }
 
         try:
@@ -1223,12 +1819,17 @@ class ShotViewerFrame(wx.Frame):
             path = Path(dlg.GetPath())
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                session = json.load(f)
+            session = read_json(path)
         except Exception as e:
             wx.MessageBox(f"Failed to read session file:\n{e}", "Error", wx.OK | wx.ICON_ERROR)
             return
 
+        # Free the current shots before parsing the session's; matplotlib
+        # artists hold reference cycles, so collect them explicitly
+        self._release_plot_data()
+        self.shot1 = self.shot2 = None
+        gc.collect()
+
         # Load shot files
         shot1_path = session.get("shot1_path")
         if shot1_path and Path(shot1_path).exists():
@@ -1269,17 +1870,22 @@ class ShotViewerFrame(wx.Frame):
         # Restore compare mode
         self.compare_cb.SetValue(session.get("compare_mode", False))
 
-        # Restore checkbox states
+        # Restore checkbox states (SetValue emits no events; freeze to repaint once)
+        self.scroll_panel.Freeze()
         for key, value in session.get("field_checkboxes", {}).items():
-            if key in self.field_checkboxes:
-                self.field_checkboxes[key].SetValue(value)
+            if key in self.fields:
+                self.fields[key].checkbox.SetValue(value)
 
         for key, value in session.get("field_secondary", {}).items():
-            if key in self.field_secondary:
-                self.field_secondary[key].SetValue(value)
+            if key in self.fields:
+                self.fields[key].secondary.SetValue(value)
+        self.scroll_panel.Thaw()
+        self._selected_cache = None
 
         # Restore field styles
-        self.field_styles = session.get("field_styles", {})
+        field_styles = session.get("field_styles", {})
+        for key, state in self.fields.items():
+            state.style = field_styles.get(key, {})
 
         # Update plot
         self._update_plot()